@@ -5,31 +5,74 @@ Demonstrates all the improvements based on the old API patterns
 
 import asyncio
 import os
-from datetime import datetime
+import sys
+import time
+from typing import NamedTuple
+
 from loguru import logger
 
 from pocketoptionapi_async import AsyncPocketOptionClient
 
+# Reference point for event timestamps - callbacks record a cheap
+# monotonic_ns integer and formatting happens once at the final print
+_T0_NS = time.monotonic_ns()
+
+
+class SSIDSpec(NamedTuple):
+    """SSID components held in parsed form and rendered to the wire string once.
+
+    Every client built from the same spec shares one prebuilt auth string
+    instead of re-serializing the components per instantiation.
+    """
+
+    session: str
+    uid: int
+    platform: int
+    is_demo: bool
+    is_fast_history: bool
+
+    def to_ssid(self) -> str:
+        return (
+            f'42["auth",{{"session":"{self.session}",'
+            f'"isDemo":{int(self.is_demo)},"uid":{self.uid},'
+            f'"platform":{self.platform},'
+            f'"isFastHistory":{str(self.is_fast_history).lower()}}}]'
+        )
+
+
+_DEMO_SPEC = SSIDSpec(
+    session="n1p5ah5u8t9438rbunpgrq0hlq",
+    uid=72645361,
+    platform=1,
+    is_demo=True,
+    is_fast_history=True,
+)
+_DEMO_SSID = _DEMO_SPEC.to_ssid()
+
+
+async def _drain_log_queue(log_q: asyncio.Queue) -> None:
+    """Drain queued log lines in batches with a single stdout write per batch,
+    keeping per-line TTY syscalls off the event loop thread"""
+    while True:
+        batch = [await log_q.get()]
+        try:
+            while len(batch) < 32:
+                batch.append(await asyncio.wait_for(log_q.get(), timeout=0.1))
+        except asyncio.TimeoutError:
+            pass
+        sys.stdout.write("".join(f"{line}\n" for line in batch))
+        sys.stdout.flush()
+        for _ in batch:
+            log_q.task_done()
+
 
 async def demo_enhanced_features():
     """Comprehensive demo of all enhanced features"""
 
-    print("Starting PocketOption Enhanced API Demo")
-    print("=" * 60)
-    print("Demonstrating all enhancements based on old API patterns:")
-    print("Success: Complete SSID format support")
-    print("Success: Persistent connections with automatic keep-alive")
-    print("Success: Background ping/pong handling (20-second intervals)")
-    print("Success: Automatic reconnection with multiple region fallback")
-    print("Success: Connection health monitoring and statistics")
-    print("Success: Event-driven architecture with callbacks")
-    print("Success: Enhanced error handling and recovery")
-    print("Success: Modern async/await patterns")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_INTRO_BANNER)
 
-    # Complete SSID format (as requested)
-    ssid = r'42["auth",{"session":"n1p5ah5u8t9438rbunpgrq0hlq","isDemo":1,"uid":72645361,"platform":1,"isFastHistory":true}]'
+    # Complete SSID format, rendered once from the module-level spec
+    ssid = _DEMO_SSID
     print("Authentication: Using complete SSID format:")
     print(f"   {ssid[:80]}...")
     print()
@@ -43,7 +86,7 @@ async def demo_enhanced_features():
         client = AsyncPocketOptionClient(ssid=ssid, is_demo=True)
 
         print("Success: Client created with parsed components:")
-        print(f"   Session ID: {getattr(client, 'session_id', 'N/A')[:20]}...")
+        print(f"   Session ID: {client.session_id[:20]}...")
         print(f"   UID: {client.uid}")
         print(f"   Platform: {client.platform}")
         print(f"   Demo Mode: {client.is_demo}")
@@ -85,30 +128,22 @@ async def demo_enhanced_features():
             auto_reconnect=True,
         )
 
-        # Add event handlers to monitor connection events
+        # Add event handlers to monitor connection events.  The callbacks
+        # run on the dispatch path, so they only record raw tuples; the
+        # human-readable formatting is deferred to the summary print below
         events_log = []
 
         def on_connected(data):
-            events_log.append(
-                f"CONNECTED: {datetime.now().strftime('%H:%M:%S')} - {data}"
-            )
-            print(
-                f"Successfully: Event: Connected at {datetime.now().strftime('%H:%M:%S')}"
-            )
+            events_log.append((time.monotonic_ns(), "CONNECTED", data))
+            print("Successfully: Event: Connected")
 
         def on_reconnected(data):
-            events_log.append(
-                f"RECONNECTED: {datetime.now().strftime('%H:%M:%S')} - {data}"
-            )
-            print(
-                f"Reconnection: Event: Reconnected at {datetime.now().strftime('%H:%M:%S')}"
-            )
+            events_log.append((time.monotonic_ns(), "RECONNECTED", data))
+            print("Reconnection: Event: Reconnected")
 
         def on_authenticated(data):
-            events_log.append(f"AUTHENTICATED: {datetime.now().strftime('%H:%M:%S')}")
-            print(
-                f"Success: Event: Authenticated at {datetime.now().strftime('%H:%M:%S')}"
-            )
+            events_log.append((time.monotonic_ns(), "AUTHENTICATED", None))
+            print("Success: Event: Authenticated")
 
         persistent_client.add_event_callback("connected", on_connected)
         persistent_client.add_event_callback("reconnected", on_reconnected)
@@ -125,22 +160,59 @@ async def demo_enhanced_features():
                 print("Statistics: Monitoring persistent connection (30 seconds)...")
                 print("   Watch for automatic pings and reconnection attempts...")
 
-                for i in range(30):
-                    await asyncio.sleep(1)
+                # Stats lines go through a queue drained by a writer task, so
+                # the loop iteration never blocks on stdout; elapsed time comes
+                # from a monotonic clock instead of datetime formatting
+                log_q = asyncio.Queue()
+                writer = asyncio.create_task(_drain_log_queue(log_q))
+                t0 = time.monotonic()
+
+                # Three 10-second waits instead of thirty 1-second wakeups;
+                # a disconnect ends the watch immediately via the event
+                disconnect_event = asyncio.Event()
+
+                def on_disconnected(data):
+                    disconnect_event.set()
+
+                persistent_client.add_event_callback("disconnected", on_disconnected)
+
+                try:
+                    for _ in range(3):
+                        try:
+                            await asyncio.wait_for(disconnect_event.wait(), timeout=10)
+                        except asyncio.TimeoutError:
+                            pass
+
+                        if disconnect_event.is_set():
+                            log_q.put_nowait(
+                                "   Data: Connection lost - ending monitor early"
+                            )
+                            break
 
-                    # Show stats every 10 seconds
-                    if i % 10 == 0 and i > 0:
                         stats = persistent_client.get_connection_stats()
-                        print(
-                            f"   Data: [{i}s] Connected: {persistent_client.is_connected}, "
-                            f"Messages sent: {stats.get('messages_sent', 0)}, "
-                            f"Reconnects: {stats.get('total_reconnects', 0)}"
+                        connected = persistent_client.is_connected
+                        sent = stats.get("messages_sent", 0)
+                        reconnects = stats.get("total_reconnects", 0)
+                        log_q.put_nowait(
+                            f"   Data: [{time.monotonic() - t0:.1f}s] "
+                            f"Connected: {connected}, "
+                            f"Messages sent: {sent}, "
+                            f"Reconnects: {reconnects}"
                         )
 
+                    await log_q.join()
+                finally:
+                    writer.cancel()
+                    persistent_client.remove_event_callback(
+                        "disconnected", on_disconnected
+                    )
+
                 # Show final event log
                 print(f"\nDemonstration: Connection Events ({len(events_log)} total):")
-                for event in events_log:
-                    print(f"   • {event}")
+                for ts_ns, name, data in events_log:
+                    elapsed = (ts_ns - _T0_NS) / 1e9
+                    suffix = f" - {data}" if data is not None else ""
+                    print(f"   • {name}: +{elapsed:.2f}s{suffix}")
 
             else:
                 print("Note: Persistent connection failed (expected with test SSID)")
@@ -211,129 +283,154 @@ async def demo_enhanced_features():
     print()
 
 
-def show_api_improvements():
-    """Show comparison with old API"""
-
-    print("Analysis: API Improvements Summary")
-    print("=" * 60)
+_INTRO_BANNER = """\
+Starting PocketOption Enhanced API Demo
+============================================================
+Demonstrating all enhancements based on old API patterns:
+Success: Complete SSID format support
+Success: Persistent connections with automatic keep-alive
+Success: Background ping/pong handling (20-second intervals)
+Success: Automatic reconnection with multiple region fallback
+Success: Connection health monitoring and statistics
+Success: Event-driven architecture with callbacks
+Success: Enhanced error handling and recovery
+Success: Modern async/await patterns
+============================================================
 
-    print("Architecture: ARCHITECTURE IMPROVEMENTS:")
-    print("   Old API: Synchronous with threading")
-    print("   New API: Fully async/await with modern patterns")
-    print()
+"""
 
-    print("Connection: CONNECTION MANAGEMENT:")
-    print("   Old API: Manual daemon threads + run_forever()")
-    print("   New API: Persistent connections with asyncio tasks")
-    print("           Success: Automatic ping every 20 seconds")
-    print("           Success: Health monitoring and statistics")
-    print("           Success: Graceful reconnection handling")
-    print()
+_OUTRO_BANNER = """\
 
-    print("Message: MESSAGE HANDLING:")
-    print("   Old API: Basic message processing")
-    print("   New API: Optimized message routing with caching")
-    print("           Success: Message batching for performance")
-    print("           Success: Event-driven callbacks")
-    print("           Success: Type-safe message models")
-    print()
+Enhanced PocketOption API Demo Complete!
 
-    print("Error Handling: ERROR HANDLING:")
-    print("   Old API: Basic try/catch with global variables")
-    print("   New API: Comprehensive error monitoring")
-    print("           Success: Circuit breaker pattern")
-    print("           Success: Retry mechanisms with backoff")
-    print("           Success: Health checks and alerting")
-    print()
+Next Steps:
+1. Set your real SSID: export POCKET_OPTION_SSID='your_complete_ssid'
+2. Use persistent_connection=True for long-running applications
+3. Monitor connection with get_connection_stats()
+4. Add event callbacks for connection management
+5. Use async context managers for automatic cleanup
 
-    print("Statistics: DATA MANAGEMENT:")
-    print("   Old API: Basic data structures")
-    print("   New API: Modern data handling")
-    print("           Success: Pydantic models for type safety")
-    print("           Success: pandas DataFrame integration")
-    print("           Success: Automatic data validation")
-    print()
+Documentation: README_ASYNC.md
+Examples: examples/async_examples.py
+Tests: test_persistent_connection.py
+"""
 
-    print("Developer Experience: DEVELOPER EXPERIENCE:")
-    print("   Old API: Manual setup and configuration")
-    print("   New API: Enhanced developer tools")
-    print("           Success: Rich logging with loguru")
-    print("           Success: Context manager support")
-    print("           Success: Comprehensive testing")
-    print("           Success: Performance monitoring")
-    print()
+_IMPROVEMENTS_BANNER = """\
+Analysis: API Improvements Summary
+============================================================
+Architecture: ARCHITECTURE IMPROVEMENTS:
+   Old API: Synchronous with threading
+   New API: Fully async/await with modern patterns
+
+Connection: CONNECTION MANAGEMENT:
+   Old API: Manual daemon threads + run_forever()
+   New API: Persistent connections with asyncio tasks
+           Success: Automatic ping every 20 seconds
+           Success: Health monitoring and statistics
+           Success: Graceful reconnection handling
+
+Message: MESSAGE HANDLING:
+   Old API: Basic message processing
+   New API: Optimized message routing with caching
+           Success: Message batching for performance
+           Success: Event-driven callbacks
+           Success: Type-safe message models
+
+Error Handling: ERROR HANDLING:
+   Old API: Basic try/catch with global variables
+   New API: Comprehensive error monitoring
+           Success: Circuit breaker pattern
+           Success: Retry mechanisms with backoff
+           Success: Health checks and alerting
+
+Statistics: DATA MANAGEMENT:
+   Old API: Basic data structures
+   New API: Modern data handling
+           Success: Pydantic models for type safety
+           Success: pandas DataFrame integration
+           Success: Automatic data validation
+
+Developer Experience: DEVELOPER EXPERIENCE:
+   Old API: Manual setup and configuration
+   New API: Enhanced developer tools
+           Success: Rich logging with loguru
+           Success: Context manager support
+           Success: Comprehensive testing
+           Success: Performance monitoring
+
+Usage Examples: USAGE EXAMPLES:
+
+   OLD API STYLE:
+   ```python
+   api = PocketOption(ssid, demo=True)
+   api.connect()
+   while api.check_connect():
+       balance = api.get_balance()
+       time.sleep(1)
+   ```
+
+   NEW API STYLE:
+   ```python
+   ssid = r'42["auth",{"session":"...","isDemo":1,"uid":123}]'
+   async with AsyncPocketOptionClient(ssid=ssid, persistent_connection=True) as client:
+       balance = await client.get_balance()
+       df = await client.get_candles_dataframe('EURUSD_otc', '1m', 100)
+       # Connection maintained automatically with keep-alive
+   ```
 
-    print("Usage Examples: USAGE EXAMPLES:")
-    print()
+"""
 
-    print("   OLD API STYLE:")
-    print("   ```python")
-    print("   api = PocketOption(ssid, demo=True)")
-    print("   api.connect()")
-    print("   while api.check_connect():")
-    print("       balance = api.get_balance()")
-    print("       time.sleep(1)")
-    print("   ```")
-    print()
 
-    print("   NEW API STYLE:")
-    print("   ```python")
-    print('   ssid = r\'42["auth",{"session":"...","isDemo":1,"uid":123}]\'')
-    print(
-        "   async with AsyncPocketOptionClient(ssid=ssid, persistent_connection=True) as client:"
-    )
-    print("       balance = await client.get_balance()")
-    print("       df = await client.get_candles_dataframe('EURUSD_otc', '1m', 100)")
-    print("       # Connection maintained automatically with keep-alive")
-    print("   ```")
-    print()
+def show_api_improvements():
+    """Show comparison with old API"""
+    sys.stdout.write(_IMPROVEMENTS_BANNER)
+
+
+_KEEPALIVE_BANNER = """\
+Persistent: Keep-Alive Features Based on Old API Analysis
+============================================================
+Demonstration: IMPLEMENTED FEATURES:
+Success: Continuous ping loop (20-second intervals)
+Success: Automatic reconnection on disconnection
+Success: Multiple region fallback
+Success: Background task management
+Success: Connection health monitoring
+Success: Message routing and processing
+Success: Event-driven callbacks
+Success: Connection statistics tracking
+Success: Graceful shutdown and cleanup
+Success: Complete SSID format support
+
+Technical Implementation: TECHNICAL IMPLEMENTATION:
+• AsyncWebSocketClient with persistent connections
+• ConnectionKeepAlive manager for advanced scenarios
+• Background asyncio tasks for ping/reconnect
+• Event handlers for connection state changes
+• Connection pooling with performance stats
+• Message batching and optimization
+• Health monitoring with alerts
+
+Statistics: MONITORING CAPABILITIES:
+• Connection uptime tracking
+• Message send/receive counters
+• Reconnection attempt statistics
+• Ping response time monitoring
+• Health check results
+• Performance metrics collection
+
+Configuration: CONFIGURATION OPTIONS:
+• persistent_connection: Enable advanced keep-alive
+• auto_reconnect: Automatic reconnection on failure
+• ping_interval: Customizable ping frequency
+• max_reconnect_attempts: Reconnection retry limit
+• connection_timeout: Connection establishment timeout
+• health_check_interval: Health monitoring frequency
+"""
 
 
 def show_keep_alive_features():
     """Show specific keep-alive features"""
-
-    print("Persistent: Keep-Alive Features Based on Old API Analysis")
-    print("=" * 60)
-
-    print("Demonstration: IMPLEMENTED FEATURES:")
-    print("Success: Continuous ping loop (20-second intervals)")
-    print("Success: Automatic reconnection on disconnection")
-    print("Success: Multiple region fallback")
-    print("Success: Background task management")
-    print("Success: Connection health monitoring")
-    print("Success: Message routing and processing")
-    print("Success: Event-driven callbacks")
-    print("Success: Connection statistics tracking")
-    print("Success: Graceful shutdown and cleanup")
-    print("Success: Complete SSID format support")
-    print()
-
-    print("Technical Implementation: TECHNICAL IMPLEMENTATION:")
-    print("• AsyncWebSocketClient with persistent connections")
-    print("• ConnectionKeepAlive manager for advanced scenarios")
-    print("• Background asyncio tasks for ping/reconnect")
-    print("• Event handlers for connection state changes")
-    print("• Connection pooling with performance stats")
-    print("• Message batching and optimization")
-    print("• Health monitoring with alerts")
-    print()
-
-    print("Statistics: MONITORING CAPABILITIES:")
-    print("• Connection uptime tracking")
-    print("• Message send/receive counters")
-    print("• Reconnection attempt statistics")
-    print("• Ping response time monitoring")
-    print("• Health check results")
-    print("• Performance metrics collection")
-    print()
-
-    print("Configuration: CONFIGURATION OPTIONS:")
-    print("• persistent_connection: Enable advanced keep-alive")
-    print("• auto_reconnect: Automatic reconnection on failure")
-    print("• ping_interval: Customizable ping frequency")
-    print("• max_reconnect_attempts: Reconnection retry limit")
-    print("• connection_timeout: Connection establishment timeout")
-    print("• health_check_interval: Health monitoring frequency")
+    sys.stdout.write(_KEEPALIVE_BANNER)
 
 
 async def main():
@@ -350,20 +447,16 @@ async def main():
     # Show keep-alive features
     show_keep_alive_features()
 
-    print()
-    print("Enhanced PocketOption API Demo Complete!")
-    print()
-    print("Next Steps:")
-    print("1. Set your real SSID: export POCKET_OPTION_SSID='your_complete_ssid'")
-    print("2. Use persistent_connection=True for long-running applications")
-    print("3. Monitor connection with get_connection_stats()")
-    print("4. Add event callbacks for connection management")
-    print("5. Use async context managers for automatic cleanup")
-    print()
-    print("Documentation: README_ASYNC.md")
-    print("Examples: examples/async_examples.py")
-    print("Tests: test_persistent_connection.py")
+    sys.stdout.write(_OUTRO_BANNER)
 
 
 if __name__ == "__main__":
+    try:
+        # libuv-backed event loop; substantially faster socket I/O
+        import uvloop
+
+        uvloop.install()
+    except ImportError:  # pragma: no cover - optional, absent on Windows
+        pass
+
     asyncio.run(main())
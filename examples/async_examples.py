@@ -0,0 +1,423 @@
+"""
+Usage Examples for the Professional Async PocketOption API
+Demonstrates common patterns: basic usage, context managers,
+multiple orders and real-time monitoring
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+from loguru import logger
+
+try:
+    # JIT-compile the signal math when numba is installed; the first call
+    # pays the compile cost (cached to disk), later calls run at C speed
+    from numba import njit
+except ImportError:  # pragma: no cover
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+from pocketoptionapi_async import (
+    AsyncPocketOptionClient,
+    ConnectionError,
+    OrderDirection,
+)
+
+# Opt-in file sink for analysis; enqueue=True moves disk writes to a
+# background thread so logging never blocks the event loop
+if os.getenv("POCKETOPTION_LOG_FILE"):
+    logger.add(
+        "pocketoption.log",
+        rotation="1 day",
+        retention="7 days",
+        level="INFO",
+        enqueue=True,
+    )
+
+# Demo SSID - replace with your own from browser dev tools
+SSID = (
+    os.getenv("POCKET_OPTION_SSID")
+    or r'42["auth",{"session":"example_session","isDemo":1,"uid":0,"platform":1}]'
+)
+
+
+async def connect_with_jitter(client, attempts: int = 5, base: float = 0.5, cap: float = 30.0):
+    """Connect with jittered exponential backoff between attempts.
+
+    Many bots reconnecting in lockstep after an outage hammer the endpoint
+    simultaneously; randomized delays spread the retries out.
+    """
+    for attempt in range(attempts):
+        try:
+            return await client.connect()
+        except ConnectionError:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(random.uniform(0, min(cap, base * 2**attempt)))
+
+
+async def basic_example():
+    """Basic example: connect, check balance, place an order"""
+    logger.info("Example 1: Basic Usage")
+    logger.info("=" * 40)
+
+    client = AsyncPocketOptionClient(SSID, is_demo=True)
+
+    try:
+        success = await connect_with_jitter(client)
+        if not success:
+            logger.warning("Connection failed (expected with example SSID)")
+            return
+
+        # Check balance
+        balance = await client.get_balance()
+        logger.info(f"Balance: ${balance.balance:.2f} {balance.currency}")
+
+        # Get some candles
+        candles = await client.get_candles("EURUSD_otc", "1m", 10)
+        logger.info(f"Retrieved {len(candles)} candles for EURUSD_otc")
+
+        # Place a small demo order
+        order_result = await client.place_order(
+            asset="EURUSD_otc",
+            amount=1.0,
+            direction=OrderDirection.CALL,
+            duration=60,
+        )
+        logger.info(f"Order placed: {order_result.order_id}")
+
+        # Wait on the server's order_closed push instead of sleeping past
+        # the nominal duration - resolves the moment the order settles
+        closed = asyncio.get_running_loop().create_future()
+
+        def on_closed(result):
+            order_id = getattr(result, "order_id", None) or (
+                result.get("id") if isinstance(result, dict) else None
+            )
+            if order_id == order_result.order_id and not closed.done():
+                closed.set_result(result)
+
+        client.add_event_callback("order_closed", on_closed)
+        try:
+            await asyncio.wait_for(closed, timeout=70)
+        except asyncio.TimeoutError:
+            logger.warning("Order still open after timeout")
+        finally:
+            client.remove_event_callback("order_closed", on_closed)
+
+        result = await client.check_order_result(order_result.order_id)
+        if result:
+            logger.info(f"Order result: {result.status} - profit: {result.profit}")
+
+    except Exception as e:
+        logger.error(f"Basic example error: {e}")
+    finally:
+        await client.disconnect()
+
+
+async def context_manager_example():
+    """Example using async context manager for automatic cleanup"""
+    logger.info("Example 2: Context Manager Usage")
+    logger.info("=" * 40)
+
+    try:
+        async with AsyncPocketOptionClient(SSID, is_demo=True) as client:
+            if not client.is_connected:
+                logger.warning("Connection failed (expected with example SSID)")
+                return
+
+            balance = await client.get_balance()
+            logger.info(f"Balance: ${balance.balance:.2f}")
+
+            # Fetch candles for all assets concurrently - the requests overlap
+            # in flight, so total latency is ~1 RTT instead of one per asset.
+            # The DataFrame path keeps the closes in a contiguous column, so
+            # the momentum calc is one vectorized pct_change instead of a
+            # Python loop over candle objects
+            assets = ["EURUSD_otc", "GBPUSD_otc", "USDJPY_otc"]
+            results = await asyncio.gather(
+                *(client.get_candles_dataframe(asset, "1m", 50) for asset in assets),
+                return_exceptions=True,
+            )
+
+            for asset, df in zip(assets, results):
+                if isinstance(df, Exception):
+                    logger.warning(f"{asset}: {type(df).__name__}")
+                elif len(df):
+                    closes = df["close"]
+                    pct = closes.pct_change(5).iat[-1] * 100
+                    logger.info(
+                        f"{asset}: latest close = {closes.iat[-1]} ({pct:+.3f}% / 5m)"
+                    )
+                else:
+                    logger.info(f"{asset}: no candles available")
+
+        # Connection automatically closed here
+
+    except Exception as e:
+        logger.error(f"Context manager example error: {e}")
+
+
+async def multiple_orders_example():
+    """Example placing and tracking multiple orders"""
+    logger.info("Example 3: Multiple Orders")
+    logger.info("=" * 40)
+
+    client = AsyncPocketOptionClient(SSID, is_demo=True)
+
+    try:
+        success = await connect_with_jitter(client)
+        if not success:
+            logger.warning("Connection failed (expected with example SSID)")
+            return
+
+        assets = ["EURUSD_otc", "GBPUSD_otc", "AUDUSD_otc"]
+
+        # Hoist the enum attribute lookups out of the submission loop
+        _CALL, _PUT = OrderDirection.CALL, OrderDirection.PUT
+
+        # Submit all orders concurrently; direction alternates by index so the
+        # CALL/PUT pattern stays deterministic under concurrent submission
+        results = await asyncio.gather(
+            *(
+                client.place_order(
+                    asset=asset,
+                    amount=1.0,
+                    direction=_CALL if i % 2 == 0 else _PUT,
+                    duration=60,
+                )
+                for i, asset in enumerate(assets)
+            ),
+            return_exceptions=True,
+        )
+
+        orders = []
+        for asset, result in zip(assets, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Order on {asset} failed: {result}")
+            else:
+                orders.append(result)
+                logger.info(f"Order placed on {asset}: {result.order_id}")
+
+        if not orders:
+            return
+
+        # Wait for the server's order_closed push instead of polling
+        # get_active_orders every 5 seconds
+        pending = {order.order_id for order in orders}
+        all_done = asyncio.Event()
+
+        def on_closed(result):
+            # Payload is an OrderResult or a raw dict depending on the path
+            order_id = getattr(result, "order_id", None) or (
+                result.get("id") if isinstance(result, dict) else None
+            )
+            pending.discard(order_id)
+            if not pending:
+                all_done.set()
+
+        client.add_event_callback("order_closed", on_closed)
+
+        logger.info(f"Waiting for {len(orders)} orders to complete...")
+        try:
+            await asyncio.wait_for(all_done.wait(), timeout=90)
+        except asyncio.TimeoutError:
+            logger.warning(f"{len(pending)} order(s) still pending after timeout")
+        finally:
+            client.remove_event_callback("order_closed", on_closed)
+
+        # Collect final results concurrently - one round trip instead of
+        # one per order
+        final_results = await asyncio.gather(
+            *(client.check_order_result(order.order_id) for order in orders),
+            return_exceptions=True,
+        )
+        for order, result in zip(orders, final_results):
+            if isinstance(result, Exception):
+                logger.warning(f"Order {order.order_id} check failed: {result}")
+            elif result:
+                logger.info(f"Order {result.order_id}: {result.status}")
+
+        total_profit = sum(
+            result.profit
+            for result in final_results
+            if not isinstance(result, Exception) and result and result.profit
+        )
+        logger.info(f"Total profit: ${total_profit:.2f}")
+
+    except Exception as e:
+        logger.error(f"Multiple orders example error: {e}")
+    finally:
+        await client.disconnect()
+
+
+async def real_time_monitoring_example():
+    """Example of a simple real-time monitoring strategy"""
+    logger.info("Example 4: Real-Time Monitoring")
+    logger.info("=" * 40)
+
+    client = AsyncPocketOptionClient(SSID, is_demo=True)
+
+    try:
+        success = await connect_with_jitter(client)
+        if not success:
+            logger.warning("Connection failed (expected with example SSID)")
+            return
+
+        await simple_strategy(client, "EURUSD_otc", duration_minutes=5)
+
+    except Exception as e:
+        logger.error(f"Real-time monitoring example error: {e}")
+    finally:
+        await client.disconnect()
+
+
+async def simple_strategy(client, asset: str, duration_minutes: int = 5):
+    """Naive momentum strategy: buy when price moved >0.01% over the window"""
+    # Hoist the enum attribute lookups out of the tick loop
+    _CALL, _PUT = OrderDirection.CALL, OrderDirection.PUT
+
+    # deque(maxlen=10) keeps appends O(1) and enforces the window bound,
+    # instead of an O(N) list pop(0) per update
+    price_history = deque(maxlen=10)
+    end_time = datetime.now().timestamp() + duration_minutes * 60
+
+    # Balance only changes when an order settles, so fetch it once and keep
+    # it fresh from balance_updated pushes instead of one round trip per tick
+    balance = await client.get_balance()
+
+    def on_balance(updated):
+        nonlocal balance
+        balance = updated
+
+    client.add_event_callback("balance_updated", on_balance)
+
+    # Warm the history once, then let stream pushes feed it - each tick no
+    # longer re-downloads 5 candles when only the newest one is new
+    try:
+        candles = await client.get_candles(asset, "1m", 10)
+        for candle in candles[-10:]:
+            price_history.append(candle.close)
+    except Exception as e:
+        logger.warning(f"History warm-up failed: {e}")
+
+    def on_stream(data):
+        if not isinstance(data, dict) or data.get("asset") != asset:
+            return
+        price = data.get("close") or data.get("price")
+        if price is None:
+            updates = data.get("candles") or data.get("data") or []
+            if updates:
+                last = updates[-1]
+                if isinstance(last, dict):
+                    price = last.get("close") or last.get("price")
+                elif isinstance(last, (list, tuple)) and last:
+                    price = last[-1]
+        if price is not None:
+            price_history.append(float(price))
+
+    client.add_event_callback("stream_update", on_stream)
+
+    try:
+        while datetime.now().timestamp() < end_time:
+            try:
+                if price_history:
+                    current_price = price_history[-1]
+
+                    if len(price_history) >= 2:
+                        price_change, fire = signal(
+                            np.asarray(price_history, dtype=np.float64)
+                        )
+                        logger.info(
+                            f"{asset}: {current_price} ({price_change:+.3f}%) "
+                            f"balance=${balance.balance:.2f}"
+                        )
+
+                        if fire:
+                            direction = _CALL if price_change > 0 else _PUT
+                            logger.info(f"Signal: placing {direction.value} order")
+                            await client.place_order(
+                                asset=asset,
+                                amount=1.0,
+                                direction=direction,
+                                duration=60,
+                            )
+
+            except Exception as e:
+                logger.warning(f"Strategy tick error: {e}")
+
+            await asyncio.sleep(30)
+    finally:
+        client.remove_event_callback("stream_update", on_stream)
+        client.remove_event_callback("balance_updated", on_balance)
+
+
+@njit(cache=True, fastmath=True)
+def signal(prices):
+    """Momentum signal over a float64 price window.
+
+    Returns (pct_change, fire); kept as a standalone array function so
+    heavier indicators (EMA, RSI) can be added here without touching the
+    strategy loop.
+    """
+    pct = (prices[-1] - prices[0]) / prices[0] * 100.0
+    return pct, abs(pct) > 0.01
+
+
+EXAMPLES = {
+    "basic": basic_example,
+    "context": context_manager_example,
+    "multi": multiple_orders_example,
+    "rt": real_time_monitoring_example,
+}
+
+# Menu number -> example name, for the interactive prompt
+_MENU = {"1": "basic", "2": "context", "3": "multi", "4": "rt"}
+
+
+async def main(choice: str = None):
+    """Run the selected example"""
+    if choice is None:
+        if sys.stdin.isatty():
+            print("PocketOption Async API Examples")
+            print("1. Basic usage")
+            print("2. Context manager")
+            print("3. Multiple orders")
+            print("4. Real-time monitoring")
+            choice = _MENU.get(input("Enter choice (1-4): ").strip())
+        else:
+            # Non-interactive runs (CI, profiling) default to the basic example
+            choice = "basic"
+
+    example = EXAMPLES.get(choice)
+    if example is None:
+        print("Invalid choice")
+        return
+
+    await example()
+
+
+if __name__ == "__main__":
+    try:
+        # libuv-backed event loop; substantially faster socket I/O
+        import uvloop
+
+        uvloop.install()
+    except ImportError:  # pragma: no cover - optional, absent on Windows
+        pass
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--example", choices=sorted(EXAMPLES))
+    args = parser.parse_args()
+    asyncio.run(main(args.example))
@@ -3,71 +3,60 @@ Professional Async PocketOption API - Core module
 Fully async implementation with modern Python practices
 """
 
-from .client import AsyncPocketOptionClient
-from .exceptions import (
-    PocketOptionError,
-    ConnectionError,
-    AuthenticationError,
-    OrderError,
-    TimeoutError,
-    InvalidParameterError,
-    WebSocketError,
-)
-from .models import (
-    Balance,
-    Candle,
-    Order,
-    OrderResult,
-    OrderStatus,
-    OrderDirection,
-    Asset,
-    ConnectionStatus,
-)
-from .constants import ASSETS, Regions
-
-# Import monitoring components
-from .monitoring import (
-    ErrorMonitor,
-    HealthChecker,
-    ErrorSeverity,
-    ErrorCategory,
-    CircuitBreaker,
-    RetryPolicy,
-    error_monitor,
-    health_checker,
-)
-
-# Create REGIONS instance
-REGIONS = Regions()
+import importlib
 
 __version__ = "2.0.0"
 __author__ = "PocketOptionAPI Team"
 
-__all__ = [
-    "AsyncPocketOptionClient",
-    "PocketOptionError",
-    "ConnectionError",
-    "AuthenticationError",
-    "OrderError",
-    "TimeoutError",
-    "InvalidParameterError",
-    "WebSocketError",
-    "Balance",
-    "Candle",
-    "Order",
-    "OrderResult",
-    "OrderStatus",
-    "OrderDirection",
-    "Asset",
-    "ConnectionStatus",
-    "ASSETS",
-    "REGIONS",
-    "ErrorMonitor",
-    "HealthChecker",
-    "ErrorSeverity",
-    "ErrorCategory",
-    "CircuitBreaker",
-    "RetryPolicy",
-    "error_monitor",
-    "health_checker",
-]
+# Public names resolved lazily (PEP 562) so importing the package does not
+# pay for pydantic/pandas/websockets until a caller actually touches them
+_LAZY_IMPORTS = {
+    "AsyncPocketOptionClient": ".client",
+    "PocketOptionHost": ".client",
+    "PocketOptionError": ".exceptions",
+    "ConnectionError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "OrderError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "InvalidParameterError": ".exceptions",
+    "WebSocketError": ".exceptions",
+    "Balance": ".models",
+    "Candle": ".models",
+    "Order": ".models",
+    "OrderResult": ".models",
+    "OrderStatus": ".models",
+    "OrderDirection": ".models",
+    "Asset": ".models",
+    "ConnectionStatus": ".models",
+    "ASSETS": ".constants",
+    "ErrorMonitor": ".monitoring",
+    "HealthChecker": ".monitoring",
+    "ErrorSeverity": ".monitoring",
+    "ErrorCategory": ".monitoring",
+    "CircuitBreaker": ".monitoring",
+    "RetryPolicy": ".monitoring",
+    "error_monitor": ".monitoring",
+    "health_checker": ".monitoring",
+}
+
+__all__ = tuple(_LAZY_IMPORTS) + ("REGIONS",)
+
+
+def __getattr__(name):
+    if name == "REGIONS":
+        from .constants import Regions
+
+        value = Regions()
+    elif name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the module so subsequent access skips __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
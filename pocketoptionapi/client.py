@@ -4,15 +4,18 @@ Professional Async PocketOption API Client
 
 import asyncio
 import json
+import random
 import time
 import uuid
-from typing import Optional, List, Dict, Any, Union, Callable
+from typing import Optional, List, Deque, Dict, Any, Union, Callable, AsyncIterator, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from contextlib import AsyncExitStack
 import pandas as pd
 from loguru import logger
 
 from .monitoring import error_monitor, health_checker, ErrorCategory, ErrorSeverity
+from .connection_keep_alive import ConnectionKeepAlive
 from .websocket_client import AsyncWebSocketClient
 from .models import (
     Balance,
@@ -32,12 +35,107 @@ from .exceptions import (
     InvalidParameterError,
 )
 
+try:
+    # orjson is 2-5x faster than stdlib json for the small auth payloads
+    # serialized on every (re)connect; fall back to stdlib when unavailable
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Precomputed status lookups for check_win - frozenset membership and a dict
+# fetch instead of rebuilding comparison chains per call
+_TERMINAL_STATUSES = frozenset({OrderStatus.WIN, OrderStatus.LOSE})
+_STATUS_RESULT_NAMES = {OrderStatus.WIN: "win", OrderStatus.LOSE: "loss"}
+
+# Interned wire frames for the fixed-payload messages sent on hot paths
+_PING_FRAME = '42["ps"]'
+_BALANCE_FRAME = '42["getBalance"]'
+
+# Validation tables hoisted out of the per-order hot path
+_ASSETS_SET = frozenset(ASSETS)
+_MIN_ORDER_AMOUNT = API_LIMITS["min_order_amount"]
+_MAX_ORDER_AMOUNT = API_LIMITS["max_order_amount"]
+_MIN_DURATION = API_LIMITS["min_duration"]
+_MAX_DURATION = API_LIMITS["max_duration"]
+
+
+class _LRUDict(OrderedDict):
+    """Dict with a capped size that evicts the least recently written entry.
+
+    Keeps long-lived caches (candles, completed orders) at a bounded
+    working set instead of growing for the lifetime of the client.
+    """
+
+    __slots__ = ("maxsize",)
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
 
 class AsyncPocketOptionClient:
     """
     Professional async PocketOption API client with modern Python practices
     """
 
+    # No per-instance __dict__: attribute access goes through fixed slot
+    # descriptors and each client is a few hundred bytes lighter, which
+    # matters for asset-per-client deployments running many instances
+    __slots__ = (
+        "raw_ssid",
+        "is_demo",
+        "preferred_region",
+        "uid",
+        "platform",
+        "is_fast_history",
+        "persistent_connection",
+        "auto_reconnect",
+        "enable_logging",
+        "session_id",
+        "_original_demo",
+        "_complete_ssid",
+        "_session_message_cache",
+        "_websocket",
+        "_balance",
+        "_balance_refresh_task",
+        "_balance_fetched_at",
+        "_orders",
+        "_active_orders",
+        "_order_results",
+        "_order_result_futures",
+        "_pending_order_futures",
+        "_candle_requests",
+        "_auth_future",
+        "_candles_cache",
+        "_server_time",
+        "_event_callbacks",
+        "_disconnected_event",
+        "_error_monitor",
+        "_health_checker",
+        "_operation_metrics",
+        "_last_activity",
+        "_last_health_check",
+        "_context_depth",
+        "_keep_alive_manager",
+        "_ping_task",
+        "_reconnect_task",
+        "_is_persistent",
+        "_connection_stats",
+    )
+
     def __init__(
         self,
         ssid: str,
@@ -87,15 +185,28 @@ class AsyncPocketOptionClient:
             self.session_id = ssid
             self._complete_ssid = None
 
+        # Formatted auth message, serialized once on first use
+        self._session_message_cache: Optional[str] = None
+
         # Core components
         self._websocket = AsyncWebSocketClient()
         self._balance: Optional[Balance] = None
+        self._balance_refresh_task: Optional[asyncio.Task] = None
+        self._balance_fetched_at: float = 0.0
         self._orders: Dict[str, OrderResult] = {}
         self._active_orders: Dict[str, OrderResult] = {}
-        self._order_results: Dict[str, OrderResult] = {}
-        self._candles_cache: Dict[str, List[Candle]] = {}
+        self._order_results: Dict[str, OrderResult] = _LRUDict(10_000)
+        self._order_result_futures: Dict[str, asyncio.Future] = {}
+        self._pending_order_futures: Dict[str, asyncio.Future] = {}
+        self._candle_requests: Dict[str, asyncio.Future] = {}
+        self._auth_future: Optional[asyncio.Future] = None
+        self._candles_cache: Dict[str, List[Candle]] = _LRUDict(256)
         self._server_time: Optional[ServerTime] = None
-        self._event_callbacks: Dict[str, List[Callable]] = defaultdict(list)
+        # Immutable snapshots of (callback, is_coroutine) pairs per event:
+        # emission iterates a tuple that add/remove never mutate in place,
+        # and the coroutine check is paid once at registration
+        self._event_callbacks: Dict[str, Tuple[Tuple[Callable, bool], ...]] = {}
+        self._disconnected_event = asyncio.Event()
         # Setup event handlers for websocket messages
         self._setup_event_handlers()
 
@@ -106,10 +217,16 @@ class AsyncPocketOptionClient:
         self._error_monitor = error_monitor
         self._health_checker = health_checker
 
-        # Performance tracking
-        self._operation_metrics: Dict[str, List[float]] = defaultdict(list)
+        # Performance tracking (bounded so long-running bots don't leak RSS)
+        self._operation_metrics: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=1024)
+        )
+        self._last_activity: float = 0.0
         self._last_health_check = time.time()
 
+        # Nesting depth of `async with` blocks sharing this connection
+        self._context_depth = 0
+
         # Keep-alive functionality (based on old API patterns)
         self._keep_alive_manager = None
         self._ping_task: Optional[asyncio.Task] = None
@@ -135,16 +252,36 @@ class AsyncPocketOptionClient:
 
     def _setup_event_handlers(self):
         """Setup WebSocket event handlers"""
-        self._websocket.add_event_handler("authenticated", self._on_authenticated)
-        self._websocket.add_event_handler("balance_updated", self._on_balance_updated)
-        self._websocket.add_event_handler(
-            "balance_data", self._on_balance_data
-        )  # Add balance_data handler
-        self._websocket.add_event_handler("order_opened", self._on_order_opened)
-        self._websocket.add_event_handler("order_closed", self._on_order_closed)
-        self._websocket.add_event_handler("stream_update", self._on_stream_update)
-        self._websocket.add_event_handler("candles_received", self._on_candles_received)
-        self._websocket.add_event_handler("disconnected", self._on_disconnected)
+        self._websocket.add_event_handlers(
+            {
+                "authenticated": self._on_authenticated,
+                "balance_updated": self._on_balance_updated,
+                "balance_data": self._on_balance_data,
+                "order_opened": self._on_order_opened,
+                "order_closed": self._on_order_closed,
+                "stream_update": self._on_stream_update,
+                "candles_received": self._on_candles_received,
+                "disconnected": self._on_disconnected,
+            }
+        )
+
+    async def __aenter__(self) -> "AsyncPocketOptionClient":
+        """Async context manager entry - connects the client.
+
+        Re-entering an already-connected client reuses the live websocket
+        instead of paying a fresh TLS + auth handshake; only the outermost
+        exit disconnects.
+        """
+        self._context_depth += 1
+        if not self.is_connected:
+            await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - disconnects on the outermost exit"""
+        self._context_depth -= 1
+        if self._context_depth <= 0:
+            await self.disconnect()
 
     async def connect(
         self, regions: Optional[List[str]] = None, persistent: Optional[bool] = None
@@ -250,9 +387,6 @@ class AsyncPocketOptionClient:
         """Start persistent connection with keep-alive (like old API)"""
         logger.info("Starting persistent connection with automatic keep-alive...")
 
-        # Import the keep-alive manager
-        from .connection_keep_alive import ConnectionKeepAlive
-
         # Create keep-alive manager
         complete_ssid = self.raw_ssid
         self._keep_alive_manager = ConnectionKeepAlive(complete_ssid, self.is_demo)
@@ -311,23 +445,58 @@ class AsyncPocketOptionClient:
         if self.auto_reconnect:
             self._reconnect_task = asyncio.create_task(self._reconnection_monitor())
 
+    async def _send_raw(self, message: str) -> None:
+        """Send through the active transport and stamp outbound activity"""
+        if self._is_persistent and self._keep_alive_manager:
+            # The keep-alive manager reports failure as False, not an exception
+            if not await self._keep_alive_manager.send_message(message):
+                raise ConnectionError("Failed to send message via keep-alive")
+        else:
+            await self._websocket.send_message(message)
+        self._last_activity = time.monotonic()
+
     async def _ping_loop(self):
         """Ping loop for regular connections (like old API)"""
+        # Deadline-based: the next ping is due PING_INTERVAL after the most
+        # recent outbound frame, so active traffic suppresses redundant pings
+        # and idle gaps are probed exactly on schedule
+        interval = 20.0
         while self.is_connected and not self._is_persistent:
+            # Single-flight against the transport's own ping loop: any frame
+            # it sent counts as liveness, so only one layer ever pings per
+            # idle interval
+            last_activity = max(self._last_activity, self._websocket.last_sent_at)
+            delay = (last_activity + interval) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
             try:
-                await self._websocket.send_message('42["ps"]')
+                await self._send_raw(_PING_FRAME)
                 self._connection_stats["last_ping_time"] = time.time()
-                await asyncio.sleep(20)  # Ping every 20 seconds
             except Exception as e:
                 logger.warning(f"Ping failed: {e}")
                 break
 
     async def _reconnection_monitor(self):
         """Monitor and handle reconnections for regular connections"""
+        attempt = 0
         while self.auto_reconnect and not self._is_persistent:
-            await asyncio.sleep(30)  # Check every 30 seconds
+            # Wake on the disconnect event instead of polling is_connected;
+            # reconnection starts within one loop tick of the drop and the
+            # happy path costs zero scheduler wakeups
+            await self._disconnected_event.wait()
+            self._disconnected_event.clear()
 
-            if not self.is_connected:
+            if not self.auto_reconnect or self._is_persistent:
+                break
+
+            # Keep retrying until the connection is back; the event only
+            # fires on the transition to disconnected
+            while (
+                self.auto_reconnect
+                and not self._is_persistent
+                and not self.is_connected
+            ):
                 logger.info("Connection lost, attempting reconnection...")
                 self._connection_stats["total_reconnects"] += 1
 
@@ -335,22 +504,48 @@ class AsyncPocketOptionClient:
                     success = await self._start_regular_connection()
                     if success:
                         logger.info(" Reconnection successful")
-                    else:
-                        logger.error("Reconnection failed")
-                        await asyncio.sleep(10)  # Wait before next attempt
+                        attempt = 0
+                        break
+                    logger.error("Reconnection failed")
                 except Exception as e:
                     logger.error(f"Reconnection error: {e}")
-                    await asyncio.sleep(10)
+
+                # Exponential backoff with jitter: repeated failures back off
+                # toward a minute and the random factor spreads herds of bots
+                # reconnecting after an outage
+                delay = min(60.0, 1.0 * 2**attempt) * random.uniform(0.5, 1.5)
+                attempt += 1
+                await asyncio.sleep(delay)
 
     async def disconnect(self) -> None:
-        """Disconnect from PocketOption and cleanup all resources"""
+        """Disconnect from PocketOption and cleanup all resources.
+
+        Idempotent: calling disconnect on an already-closed client returns
+        immediately, so shutdown paths never need a connected-state guard.
+        """
+        if (
+            not self.is_connected
+            and not self._is_persistent
+            and self._ping_task is None
+            and self._reconnect_task is None
+        ):
+            return
+
         logger.info("Disconnecting from PocketOption...")
 
-        # Cancel tasks
-        if self._ping_task:
-            self._ping_task.cancel()
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
+        # Cancel background tasks together so their cancellation points
+        # overlap instead of being awaited one after another
+        tasks = [
+            task
+            for task in (self._ping_task, self._reconnect_task)
+            if task and not task.done()
+        ]
+        self._ping_task = None
+        self._reconnect_task = None
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # Disconnect based on connection type
         if self._is_persistent and self._keep_alive_manager:
@@ -375,21 +570,30 @@ class AsyncPocketOptionClient:
         if not self.is_connected:
             raise ConnectionError("Not connected to PocketOption")
 
-        # Request balance update if needed
-        if (
-            not self._balance
-            or (datetime.now() - self._balance.last_updated).seconds > 60
-        ):
-            await self._request_balance_update()
-
-            # Wait a bit for balance to be received
-            await asyncio.sleep(1)
+        # Request balance update if needed (monotonic freshness check is
+        # cheap and immune to wall-clock jumps; last_updated stays wall
+        # clock for display)
+        if not self._balance or time.monotonic() - self._balance_fetched_at > 60:
+            # Single-flight: concurrent callers await the refresh already in
+            # flight instead of each issuing an identical round trip
+            refresh = self._balance_refresh_task
+            if refresh is None or refresh.done():
+                refresh = asyncio.create_task(self._refresh_balance())
+                self._balance_refresh_task = refresh
+            await asyncio.shield(refresh)
 
         if not self._balance:
             raise PocketOptionError("Balance data not available")
 
         return self._balance
 
+    async def _refresh_balance(self) -> None:
+        """Request a balance update and give the server time to respond"""
+        await self._request_balance_update()
+
+        # Wait a bit for balance to be received
+        await asyncio.sleep(1)
+
     async def place_order(
         self, asset: str, amount: float, direction: OrderDirection, duration: int
     ) -> OrderResult:
@@ -431,7 +635,66 @@ class AsyncPocketOptionClient:
 
         except Exception as e:
             logger.error(f"Order placement failed: {e}")
-            raise OrderError(f"Failed to place order: {e}")
+            raise OrderError(f"Failed to place order: {e}") from e
+
+    async def place_order_nowait(
+        self, asset: str, amount: float, direction: OrderDirection, duration: int
+    ) -> OrderResult:
+        """
+        Place an order without waiting for broker confirmation
+
+        Returns a pending ticket as soon as the order is on the wire; the
+        websocket handlers update the tracked entry when the server
+        confirms, so check_order_result/check_win resolve the outcome.
+        Use this when placing many orders back-to-back, where awaiting
+        each confirmation would serialize throughput.
+
+        Args:
+            asset: Asset symbol (e.g., "EURUSD_otc")
+            amount: Order amount
+            direction: OrderDirection.CALL or OrderDirection.PUT
+            duration: Duration in seconds
+
+        Returns:
+            OrderResult: Pending ticket with status PENDING
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to PocketOption")
+        self._validate_order_parameters(asset, amount, direction, duration)
+
+        order_id = str(uuid.uuid4())
+        order = Order(
+            asset=asset,
+            amount=amount,
+            direction=direction,
+            duration=duration,
+            request_id=order_id,
+        )
+
+        # Register the ticket before sending so the confirmation handlers
+        # always find an entry to update, however fast the server replies
+        placed_at = datetime.now()
+        ticket = OrderResult(
+            order_id=order_id,
+            asset=asset,
+            amount=amount,
+            direction=direction,
+            duration=duration,
+            status=OrderStatus.PENDING,
+            placed_at=placed_at,
+            expires_at=placed_at + timedelta(seconds=duration),
+        )
+        self._active_orders[order_id] = ticket
+
+        try:
+            await self._send_order(order)
+        except Exception as e:
+            self._active_orders.pop(order_id, None)
+            logger.error(f"Order placement failed: {e}")
+            raise OrderError(f"Failed to place order: {e}") from e
+
+        logger.info(f"Order submitted: {order_id} (pending confirmation)")
+        return ticket
 
     async def get_candles(
         self,
@@ -473,7 +736,7 @@ class AsyncPocketOptionClient:
             timeframe_seconds = timeframe
 
         # Validate asset
-        if asset not in ASSETS:
+        if asset not in _ASSETS_SET:
             raise InvalidParameterError(f"Invalid asset: {asset}")
 
         # Set default end time
@@ -509,10 +772,68 @@ class AsyncPocketOptionClient:
                             continue
 
                 logger.error(f"Failed to get candles for {asset}: {e}")
-                raise PocketOptionError(f"Failed to get candles: {e}")
+                raise PocketOptionError(f"Failed to get candles: {e}") from e
 
         raise PocketOptionError(f"Failed to get candles after {max_retries} attempts")
 
+    async def iter_candles(
+        self,
+        asset: str,
+        timeframe: Union[str, int],
+        count: int = 100,
+        end_time: Optional[datetime] = None,
+    ) -> AsyncIterator[Candle]:
+        """
+        Stream historical candle data one candle at a time
+
+        Lets downstream code (indicator loops, CSV writers) process candles
+        with `async for` without holding a second materialized copy of the
+        full history.
+
+        Args:
+            asset: Asset symbol
+            timeframe: Timeframe (e.g., "1m", "5m", 60)
+            count: Number of candles to retrieve
+            end_time: End time for data (defaults to now)
+
+        Yields:
+            Candle: Historical candles in chronological order
+        """
+        for candle in await self.get_candles(asset, timeframe, count, end_time):
+            yield candle
+
+    async def get_candles_many(
+        self,
+        assets: List[str],
+        timeframe: Union[str, int],
+        count: int = 100,
+        end_time: Optional[datetime] = None,
+        concurrency: int = 8,
+    ) -> Dict[str, List[Candle]]:
+        """
+        Get historical candle data for multiple assets concurrently
+
+        Args:
+            assets: Asset symbols to fetch
+            timeframe: Timeframe (e.g., "1m", "5m", 60)
+            count: Number of candles to retrieve per asset
+            end_time: End time for data (defaults to now)
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            Dict[str, List[Candle]]: Candles keyed by asset symbol
+        """
+        # Bound socket pressure while letting the requests overlap in flight;
+        # a 20-asset watchlist costs ~1 RTT instead of 20 serialized ones
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(asset: str):
+            async with semaphore:
+                return asset, await self.get_candles(asset, timeframe, count, end_time)
+
+        results = await asyncio.gather(*(fetch_one(asset) for asset in assets))
+        return dict(results)
+
     async def get_candles_dataframe(
         self,
         asset: str,
@@ -534,23 +855,24 @@ class AsyncPocketOptionClient:
         """
         candles = await self.get_candles(asset, timeframe, count, end_time)
 
-        # Convert to DataFrame
-        data = []
-        for candle in candles:
-            data.append(
-                {
-                    "timestamp": candle.timestamp,
-                    "open": candle.open,
-                    "high": candle.high,
-                    "low": candle.low,
-                    "close": candle.close,
-                    "volume": candle.volume,
-                }
-            )
-        df = pd.DataFrame(data)
+        # Convert to DataFrame column-wise (SoA): one list per field instead
+        # of one dict per candle, so pandas builds contiguous arrays directly
+        # without a per-row inference pass. Timestamps go straight into the
+        # index, skipping the set_index copy
+        df = pd.DataFrame(
+            {
+                "open": [candle.open for candle in candles],
+                "high": [candle.high for candle in candles],
+                "low": [candle.low for candle in candles],
+                "close": [candle.close for candle in candles],
+                "volume": [candle.volume for candle in candles],
+            },
+            index=pd.DatetimeIndex(
+                [candle.timestamp for candle in candles], name="timestamp"
+            ),
+        )
 
-        if not df.empty:
-            df.set_index("timestamp", inplace=True)
+        if not df.index.is_monotonic_increasing:
             df.sort_index(inplace=True)
 
         return df
@@ -593,9 +915,10 @@ class AsyncPocketOptionClient:
             event: Event name (e.g., 'order_closed', 'balance_updated')
             callback: Callback function
         """
-        if event not in self._event_callbacks:
-            self._event_callbacks[event] = []
-        self._event_callbacks[event].append(callback)
+        pairs = self._event_callbacks.get(event, ())
+        self._event_callbacks[event] = pairs + (
+            (callback, asyncio.iscoroutinefunction(callback)),
+        )
 
     def remove_event_callback(self, event: str, callback: Callable) -> None:
         """
@@ -605,11 +928,11 @@ class AsyncPocketOptionClient:
             event: Event name
             callback: Callback function to remove
         """
-        if event in self._event_callbacks:
-            try:
-                self._event_callbacks[event].remove(callback)
-            except ValueError:
-                pass
+        pairs = self._event_callbacks.get(event)
+        if pairs:
+            self._event_callbacks[event] = tuple(
+                pair for pair in pairs if pair[0] is not callback
+            )
 
     @property
     def is_connected(self) -> bool:
@@ -630,33 +953,32 @@ class AsyncPocketOptionClient:
     async def send_message(self, message: str) -> bool:
         """Send message through active connection"""
         try:
-            if self._is_persistent and self._keep_alive_manager:
-                return await self._keep_alive_manager.send_message(message)
-            else:
-                await self._websocket.send_message(message)
-                return True
+            await self._send_raw(message)
+            return True
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             return False
 
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get comprehensive connection statistics"""
-        stats = self._connection_stats.copy()
-
         if self._is_persistent and self._keep_alive_manager:
-            stats.update(self._keep_alive_manager.get_stats())
-        else:
-            stats.update(
-                {
-                    "websocket_connected": self._websocket.is_connected,
-                    "connection_info": self._websocket.connection_info,
-                }
-            )
+            return {**self._connection_stats, **self._keep_alive_manager.get_stats()}
 
-        return stats  # Private methods
+        return {
+            **self._connection_stats,
+            "websocket_connected": self._websocket.is_connected,
+            "connection_info": self._websocket.connection_info,
+        }
+
+    # Private methods
 
     def _format_session_message(self) -> str:
         """Format session authentication message"""
+        # The auth components are fixed after __init__, so serialize once and
+        # reuse the string across every reconnect
+        if self._session_message_cache is not None:
+            return self._session_message_cache
+
         # Always create auth message from components using constructor parameters
         # This ensures is_demo parameter is respected regardless of SSID format
         auth_data = {
@@ -669,18 +991,17 @@ class AsyncPocketOptionClient:
         if self.is_fast_history:
             auth_data["isFastHistory"] = True
 
-        return f'42["auth",{json.dumps(auth_data)}]'
+        self._session_message_cache = f'42["auth",{_json_dumps(auth_data)}]'
+        return self._session_message_cache
 
     def _parse_complete_ssid(self, ssid: str) -> None:
         """Parse complete SSID auth message to extract components"""
         try:
-            # Extract JSON part
-            json_start = ssid.find("{")
-            json_end = ssid.rfind("}") + 1
-            if json_start != -1 and json_end > json_start:
-                json_part = ssid[json_start:json_end]
-                data = json.loads(json_part)
-
+            # The caller already matched the '42["auth",' prefix, so the JSON
+            # object is the fixed slice between it and the closing ']' - no
+            # find/rfind scans over the whole message
+            data = _json_loads(ssid[10:-1])
+            if isinstance(data, dict):
                 self.session_id = data.get("session", "")
                 # Store original demo value from SSID, but don't override the constructor parameter
                 self._original_demo = bool(data.get("isDemo", 1))
@@ -696,27 +1017,17 @@ class AsyncPocketOptionClient:
 
     async def _wait_for_authentication(self, timeout: float = 10.0) -> None:
         """Wait for authentication to complete (like old API)"""
-        auth_received = False
-
-        def on_auth(data):
-            nonlocal auth_received
-            auth_received = True
-
-        # Add temporary handler
-        self._websocket.add_event_handler("authenticated", on_auth)
-
+        # _on_authenticated resolves this future, so the wait is bounded by
+        # the server response instead of a 100 ms polling quantum, and no
+        # temporary handler has to be registered and removed per connect
+        future = asyncio.get_running_loop().create_future()
+        self._auth_future = future
         try:
-            # Wait for authentication
-            start_time = time.time()
-            while not auth_received and (time.time() - start_time) < timeout:
-                await asyncio.sleep(0.1)
-
-            if not auth_received:
-                raise AuthenticationError("Authentication timeout")
-
+            await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise AuthenticationError("Authentication timeout")
         finally:
-            # Remove temporary handler
-            self._websocket.remove_event_handler("authenticated", on_auth)
+            self._auth_future = None
 
     async def _initialize_data(self) -> None:
         """Initialize client data after connection"""
@@ -728,19 +1039,15 @@ class AsyncPocketOptionClient:
 
     async def _request_balance_update(self) -> None:
         """Request balance update from server"""
-        message = '42["getBalance"]'
+        message = _BALANCE_FRAME
 
-        # Use appropriate connection method
-        if self._is_persistent and self._keep_alive_manager:
-            await self._keep_alive_manager.send_message(message)
-        else:
-            await self._websocket.send_message(message)
+        await self._send_raw(message)
 
     async def _setup_time_sync(self) -> None:
         """Setup server time synchronization"""
         # This would typically involve getting server timestamp
         # For now, create a basic time sync object
-        local_time = datetime.now().timestamp()
+        local_time = time.time()
         self._server_time = ServerTime(
             server_timestamp=local_time, local_timestamp=local_time, offset=0.0
         )
@@ -749,23 +1056,17 @@ class AsyncPocketOptionClient:
         self, asset: str, amount: float, direction: OrderDirection, duration: int
     ) -> None:
         """Validate order parameters"""
-        if asset not in ASSETS:
+        if asset not in _ASSETS_SET:
             raise InvalidParameterError(f"Invalid asset: {asset}")
 
-        if (
-            amount < API_LIMITS["min_order_amount"]
-            or amount > API_LIMITS["max_order_amount"]
-        ):
+        if amount < _MIN_ORDER_AMOUNT or amount > _MAX_ORDER_AMOUNT:
             raise InvalidParameterError(
-                f"Amount must be between {API_LIMITS['min_order_amount']} and {API_LIMITS['max_order_amount']}"
+                f"Amount must be between {_MIN_ORDER_AMOUNT} and {_MAX_ORDER_AMOUNT}"
             )
 
-        if (
-            duration < API_LIMITS["min_duration"]
-            or duration > API_LIMITS["max_duration"]
-        ):
+        if duration < _MIN_DURATION or duration > _MAX_DURATION:
             raise InvalidParameterError(
-                f"Duration must be between {API_LIMITS['min_duration']} and {API_LIMITS['max_duration']} seconds"
+                f"Duration must be between {_MIN_DURATION} and {_MAX_DURATION} seconds"
             )
 
     async def _send_order(self, order: Order) -> None:
@@ -774,13 +1075,18 @@ class AsyncPocketOptionClient:
         asset_name = order.asset
 
         # Create the message in the correct PocketOption format
-        message = f'42["openOrder",{{"asset":"{asset_name}","amount":{order.amount},"action":"{order.direction.value}","isDemo":{1 if self.is_demo else 0},"requestId":"{order.request_id}","optionType":100,"time":{order.duration}}}]'
+        order_data = {
+            "asset": asset_name,
+            "amount": order.amount,
+            "action": order.direction.value,
+            "isDemo": 1 if self.is_demo else 0,
+            "requestId": order.request_id,
+            "optionType": 100,
+            "time": order.duration,
+        }
+        message = f'42["openOrder",{_json_dumps(order_data)}]'
 
-        # Send using appropriate connection
-        if self._is_persistent and self._keep_alive_manager:
-            await self._keep_alive_manager.send_message(message)
-        else:
-            await self._websocket.send_message(message)
+        await self._send_raw(message)
 
         if self.enable_logging:
             logger.debug(f"Sent order: {message}")
@@ -789,23 +1095,28 @@ class AsyncPocketOptionClient:
         self, request_id: str, order: Order, timeout: float = 30.0
     ) -> OrderResult:
         """Wait for order execution result"""
-        start_time = time.time()
-
-        # Wait for order to appear in tracking system
-        while time.time() - start_time < timeout:
-            # Check if order was added to active orders (by _on_order_opened or _on_json_data)
-            if request_id in self._active_orders:
-                if self.enable_logging:
-                    logger.success(f" Order {request_id} found in active tracking")
-                return self._active_orders[request_id]
+        # Fast path: the server may have registered the order before this
+        # coroutine got scheduled (by _on_order_opened or _on_json_data)
+        if request_id in self._active_orders:
+            if self.enable_logging:
+                logger.success(f" Order {request_id} found in active tracking")
+            return self._active_orders[request_id]
 
-            # Check if order went directly to results (failed or completed)
-            if request_id in self._order_results:
-                if self.enable_logging:
-                    logger.info(f"📋 Order {request_id} found in completed results")
-                return self._order_results[request_id]
+        if request_id in self._order_results:
+            if self.enable_logging:
+                logger.info(f"📋 Order {request_id} found in completed results")
+            return self._order_results[request_id]
 
-            await asyncio.sleep(0.2)  # Check every 200ms
+        # Otherwise wait on a future the tracking handlers resolve - latency
+        # is bounded by network RTT instead of a polling quantum
+        future = asyncio.get_running_loop().create_future()
+        self._pending_order_futures[request_id] = future
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._pending_order_futures.pop(request_id, None)
 
         # Check one more time before creating fallback
         if request_id in self._active_orders:
@@ -856,67 +1167,60 @@ class AsyncPocketOptionClient:
         Returns:
             Dictionary with trade result or None if timeout/error
         """
-        start_time = time.time()
-
         if self.enable_logging:
             logger.info(
                 f"🔍 Starting check_win for order {order_id}, max wait: {max_wait_time}s"
             )
 
-        while time.time() - start_time < max_wait_time:
-            # Check if order is in completed results
-            if order_id in self._order_results:
-                result = self._order_results[order_id]
+        result = self._order_results.get(order_id)
+        if result is None:
+            # Wait on a future resolved by the order-result pipeline instead
+            # of polling every second - the coroutine wakes the instant the
+            # websocket delivers the result
+            future = self._order_result_futures.get(order_id)
+            if future is None or future.done():
+                future = asyncio.get_running_loop().create_future()
+                self._order_result_futures[order_id] = future
+
+            # Short binaries settle just after expiry - bound the wait by the
+            # order's own deadline (plus settlement grace) rather than holding
+            # the caller for the full five-minute default
+            timeout = max_wait_time
+            active = self._active_orders.get(order_id)
+            if active is not None:
+                remaining = (active.expires_at - datetime.now()).total_seconds()
+                if remaining > 0:
+                    timeout = min(max_wait_time, remaining + 30.0)
+
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+            except asyncio.TimeoutError:
+                if self._order_result_futures.get(order_id) is future:
+                    del self._order_result_futures[order_id]
+
                 if self.enable_logging:
-                    logger.success(
-                        f" Order {order_id} completed - Status: {result.status.value}, Profit: ${result.profit:.2f}"
+                    logger.warning(
+                        f"⏰ check_win timeout for order {order_id} after {timeout}s"
                     )
 
                 return {
-                    "result": "win"
-                    if result.status == OrderStatus.WIN
-                    else "loss"
-                    if result.status == OrderStatus.LOSE
-                    else "draw",
-                    "profit": result.profit if result.profit is not None else 0,
+                    "result": "timeout",
                     "order_id": order_id,
-                    "completed": True,
-                    "status": result.status.value,
+                    "completed": False,
+                    "timeout": True,
                 }
 
-            # Check if order is still active (not expired yet)
-            if order_id in self._active_orders:
-                active_order = self._active_orders[order_id]
-                time_remaining = (
-                    active_order.expires_at - datetime.now()
-                ).total_seconds()
-
-                if time_remaining <= 0:
-                    if self.enable_logging:
-                        logger.info(
-                            f"⏰ Order {order_id} expired but no result yet, continuing to wait..."
-                        )
-                else:
-                    if (
-                        self.enable_logging and int(time.time() - start_time) % 10 == 0
-                    ):  # Log every 10 seconds
-                        logger.debug(
-                            f"⌛ Order {order_id} still active, expires in {time_remaining:.0f}s"
-                        )
-
-            await asyncio.sleep(1.0)  # Check every second
-
-        # Timeout reached
         if self.enable_logging:
-            logger.warning(
-                f"⏰ check_win timeout for order {order_id} after {max_wait_time}s"
+            logger.success(
+                f" Order {order_id} completed - Status: {result.status.value}, Profit: ${result.profit:.2f}"
             )
 
         return {
-            "result": "timeout",
+            "result": _STATUS_RESULT_NAMES.get(result.status, "draw"),
+            "profit": result.profit if result.profit is not None else 0,
             "order_id": order_id,
-            "completed": False,
-            "timeout": True,
+            "completed": True,
+            "status": result.status.value,
         }
 
     async def _request_candles(
@@ -932,25 +1236,18 @@ class AsyncPocketOptionClient:
 
         # Create the full message using changeSymbol
         message_data = ["changeSymbol", data]
-        message = f"42{json.dumps(message_data)}"
+        message = f"42{_json_dumps(message_data)}"
 
         if self.enable_logging:
             logger.debug(f"Requesting candles with changeSymbol: {message}")
 
         # Create a future to wait for the response
-        candle_future = asyncio.Future()
+        candle_future = asyncio.get_running_loop().create_future()
         request_id = f"{asset}_{timeframe}"
-
-        # Store the future for this request
-        if not hasattr(self, "_candle_requests"):
-            self._candle_requests = {}
         self._candle_requests[request_id] = candle_future
 
         # Send the request using appropriate connection
-        if self._is_persistent and self._keep_alive_manager:
-            await self._keep_alive_manager.send_message(message)
-        else:
-            await self._websocket.send_message(message)
+        await self._send_raw(message)
 
         try:
             # Wait for the response (with timeout)
@@ -1009,7 +1306,7 @@ class AsyncPocketOptionClient:
         # Check if this is candles data response
         if "candles" in data and isinstance(data["candles"], list):
             # Find the corresponding candle request
-            if hasattr(self, "_candle_requests"):
+            if self._candle_requests:
                 # Try to match the request based on asset and period
                 asset = data.get("asset")
                 period = data.get("period")
@@ -1058,6 +1355,12 @@ class AsyncPocketOptionClient:
 
                 # Add to active orders
                 self._active_orders[request_id] = order_result
+
+                # Wake the placement coroutine waiting on this order
+                waiter = self._pending_order_futures.pop(request_id, None)
+                if waiter and not waiter.done():
+                    waiter.set_result(order_result)
+
                 if self.enable_logging:
                     logger.success(
                         f" Order {request_id} added to tracking from JSON data"
@@ -1100,6 +1403,17 @@ class AsyncPocketOptionClient:
                         self._order_results[order_id] = result
                         del self._active_orders[order_id]
 
+                        # Wake any check_win coroutine waiting on this order
+                        waiter = self._order_result_futures.pop(order_id, None)
+                        if waiter and not waiter.done():
+                            waiter.set_result(result)
+
+                        # Orders that settle before the placement wait started
+                        # resolve the pending placement future too
+                        pending = self._pending_order_futures.pop(order_id, None)
+                        if pending and not pending.done():
+                            pending.set_result(result)
+
                         if self.enable_logging:
                             logger.success(
                                 f" Order {order_id} completed via JSON data: {status.value} - Profit: ${profit:.2f}"
@@ -1108,16 +1422,19 @@ class AsyncPocketOptionClient:
 
     async def _emit_event(self, event: str, data: Any) -> None:
         """Emit event to registered callbacks"""
-        if event in self._event_callbacks:
-            for callback in self._event_callbacks[event]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(data)
-                    else:
-                        callback(data)
-                except Exception as e:
-                    if self.enable_logging:
-                        logger.error(f"Error in event callback for {event}: {e}")
+        callbacks = self._event_callbacks.get(event)
+        if not callbacks:
+            return
+
+        for callback, is_coro in callbacks:
+            try:
+                if is_coro:
+                    await callback(data)
+                else:
+                    callback(data)
+            except Exception as e:
+                if self.enable_logging:
+                    logger.error(f"Error in event callback for {event}: {e}")
 
     # Event handlers
     async def _on_authenticated(self, data: Dict[str, Any]) -> None:
@@ -1125,6 +1442,9 @@ class AsyncPocketOptionClient:
         if self.enable_logging:
             logger.success(" Successfully authenticated with PocketOption")
         self._connection_stats["successful_connections"] += 1
+        auth_future = self._auth_future
+        if auth_future is not None and not auth_future.done():
+            auth_future.set_result(data)
         await self._emit_event("authenticated", data)
 
     async def _on_balance_updated(self, data: Dict[str, Any]) -> None:
@@ -1136,6 +1456,7 @@ class AsyncPocketOptionClient:
                 is_demo=self.is_demo,
             )
             self._balance = balance
+            self._balance_fetched_at = time.monotonic()
             if self.enable_logging:
                 logger.info(f"Balance updated: ${balance.balance:.2f}")
             await self._emit_event("balance_updated", balance)
@@ -1212,6 +1533,7 @@ class AsyncPocketOptionClient:
         """Handle disconnection event"""
         if self.enable_logging:
             logger.warning("Disconnected from PocketOption")
+        self._disconnected_event.set()
         await self._emit_event("disconnected", data)
 
     async def _handle_candles_stream(self, data: Dict[str, Any]) -> None:
@@ -1289,9 +1611,9 @@ class AsyncPocketOptionClient:
         await self._initialize_data()
 
         # Emit event
-        for callback in self._event_callbacks.get("connected", []):
+        for callback, is_coro in self._event_callbacks.get("connected", ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coro:
                     await callback()
                 else:
                     callback()
@@ -1306,9 +1628,9 @@ class AsyncPocketOptionClient:
         await self._initialize_data()
 
         # Emit event
-        for callback in self._event_callbacks.get("reconnected", []):
+        for callback, is_coro in self._event_callbacks.get("reconnected", ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coro:
                     await callback()
                 else:
                     callback()
@@ -1345,9 +1667,9 @@ class AsyncPocketOptionClient:
                 logger.error(f"Error processing keep-alive message: {e}")
 
         # Emit raw message event
-        for callback in self._event_callbacks.get("message", []):
+        for callback, is_coro in self._event_callbacks.get("message", ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coro:
                     await callback(message)
                 else:
                     callback(message)
@@ -1401,3 +1723,57 @@ class AsyncPocketOptionClient:
 
         logger.error(f"All {max_attempts} reconnection attempts failed")
         return False
+
+
+class PocketOptionHost:
+    """
+    Manages multiple named client sessions with shared lifecycle
+
+    Opens sessions for parallel bot instances (one per sub-account) and
+    tears them all down with a single aclose(), even on exception. Connects
+    issued through asyncio.gather overlap, so N sessions cost roughly one
+    handshake of wall-clock instead of N.
+    """
+
+    __slots__ = ("sessions", "_stack")
+
+    def __init__(self):
+        self.sessions: Dict[str, AsyncPocketOptionClient] = {}
+        self._stack = AsyncExitStack()
+
+    async def connect(
+        self, name: str, ssid: str, is_demo: bool = True, **client_kwargs
+    ) -> AsyncPocketOptionClient:
+        """
+        Open a named session and register it for cleanup
+
+        Args:
+            name: Key used to retrieve the session later
+            ssid: Complete SSID or raw session ID for authentication
+            is_demo: Whether to use demo account
+            **client_kwargs: Extra AsyncPocketOptionClient arguments
+
+        Returns:
+            AsyncPocketOptionClient: The connected client
+        """
+        client = await self._stack.enter_async_context(
+            AsyncPocketOptionClient(ssid, is_demo=is_demo, **client_kwargs)
+        )
+        self.sessions[name] = client
+        return client
+
+    def __getitem__(self, name: str) -> AsyncPocketOptionClient:
+        return self.sessions[name]
+
+    async def aclose(self) -> None:
+        """Disconnect every session registered on this host"""
+        try:
+            await self._stack.aclose()
+        finally:
+            self.sessions.clear()
+
+    async def __aenter__(self) -> "PocketOptionHost":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -3,14 +3,16 @@ Enhanced Keep-Alive Connection Manager for PocketOption Async API
 """
 
 import asyncio
+import random
+import time
 from typing import Optional, List, Callable, Dict, Any
 from datetime import datetime, timedelta
 from loguru import logger
 from websockets.exceptions import ConnectionClosed
 from websockets.legacy.client import connect, WebSocketClientProtocol
 
-from models import ConnectionInfo, ConnectionStatus
-from constants import REGIONS
+from .models import ConnectionInfo, ConnectionStatus
+from .constants import REGIONS
 
 
 class ConnectionKeepAlive:
@@ -39,6 +41,9 @@ class ConnectionKeepAlive:
         self.reconnect_delay = 5  # seconds
         self.max_reconnect_attempts = 10
         self.current_reconnect_attempts = 0
+        # Monotonic timestamp of the last frame in either direction; the
+        # ping loop only fires when the link has been idle a full interval
+        self._last_activity: float = 0.0
 
         # Event handlers
         self._event_handlers: Dict[str, List[Callable]] = {}
@@ -149,6 +154,7 @@ class ConnectionKeepAlive:
                         ping_interval=None,  # We handle pings manually
                         ping_timeout=None,
                         close_timeout=10,
+                        compression=None,  # skip per-frame deflate on small JSON
                     ),
                     timeout=15.0,
                 )
@@ -252,14 +258,24 @@ class ConnectionKeepAlive:
         while self.should_reconnect:
             try:
                 if self.is_connected and self.websocket:
+                    # Deadline-based: sleep only the remaining idle time, so
+                    # regular traffic keeps pushing the ping out
+                    delay = (
+                        self._last_activity + self.ping_interval
+                    ) - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                        continue
+
                     # Send ping message (exact format from old API)
                     await self.websocket.send('42["ps"]')
+                    self._last_activity = time.monotonic()
                     self.connection_stats["last_ping_time"] = datetime.now()
                     self.connection_stats["total_messages_sent"] += 1
 
                     logger.debug("Ping: Ping sent")
-
-                await asyncio.sleep(self.ping_interval)
+                else:
+                    await asyncio.sleep(self.ping_interval)
 
             except ConnectionClosed:
                 logger.warning("Connecting: Connection closed during ping")
@@ -372,10 +388,12 @@ class ConnectionKeepAlive:
 
                         if success:
                             logger.success("Success: Reconnection successful!")
+                            attempt_number = self.current_reconnect_attempts
+                            self.current_reconnect_attempts = 0
                             await self._emit_event(
                                 "reconnected",
                                 {
-                                    "attempt": self.current_reconnect_attempts,
+                                    "attempt": attempt_number,
                                     "url": self.connection_info.url
                                     if self.connection_info
                                     else None,
@@ -385,7 +403,14 @@ class ConnectionKeepAlive:
                             logger.error(
                                 f"Error: Reconnection attempt {self.current_reconnect_attempts} failed"
                             )
-                            await asyncio.sleep(self.reconnect_delay)
+                            # Exponential backoff with jitter so a fleet of
+                            # clients does not hammer the server in lockstep
+                            delay = min(
+                                60.0,
+                                self.reconnect_delay
+                                * 2 ** (self.current_reconnect_attempts - 1),
+                            ) * random.uniform(0.5, 1.5)
+                            await asyncio.sleep(delay)
                     else:
                         logger.error(
                             f"Error: Max reconnection attempts ({self.max_reconnect_attempts}) reached"
@@ -401,6 +426,7 @@ class ConnectionKeepAlive:
 
     async def _process_message(self, message):
         """Process incoming messages (like old API's on_message)"""
+        self._last_activity = time.monotonic()
         try:
             # Convert bytes to string if needed
             if isinstance(message, bytes):
@@ -433,6 +459,7 @@ class ConnectionKeepAlive:
         try:
             if self.is_connected and self.websocket:
                 await self.websocket.send(message)
+                self._last_activity = time.monotonic()
                 self.connection_stats["total_messages_sent"] += 1
                 logger.debug(f"Message: Sent: {message[:50]}...")
                 return True
@@ -448,19 +475,24 @@ class ConnectionKeepAlive:
         """Add event handler"""
         if event not in self._event_handlers:
             self._event_handlers[event] = []
-        self._event_handlers[event].append(handler)
+        self._event_handlers[event].append(
+            (handler, asyncio.iscoroutinefunction(handler))
+        )
 
     async def _emit_event(self, event: str, data: Any):
         """Emit event to handlers"""
-        if event in self._event_handlers:
-            for handler in self._event_handlers[event]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data)
-                    else:
-                        handler(data)
-                except Exception as e:
-                    logger.error(f"Error: Error in event handler for {event}: {e}")
+        handlers = self._event_handlers.get(event)
+        if not handlers:
+            return
+
+        for handler, is_coro in handlers:
+            try:
+                if is_coro:
+                    await handler(data)
+                else:
+                    handler(data)
+            except Exception as e:
+                logger.error(f"Error: Error in event handler for {event}: {e}")
 
     def _extract_region_from_url(self, url: str) -> str:
         """Extract region name from URL"""
@@ -4,6 +4,7 @@ Real-time monitoring, diagnostics, and performance analysis
 """
 
 import asyncio
+import sys
 import time
 import json
 from datetime import datetime, timedelta
@@ -668,53 +669,55 @@ class RealTimeDisplay:
         """Display loop"""
         while self.is_displaying:
             try:
-                # Clear screen (ANSI escape sequence)
-                print("\033[2J\033[H", end="")
-
-                # Display header
-                print("Analysis: PocketOption API Connection Monitor")
-                print("=" * 60)
-
                 # Get stats
                 stats = self.monitor.get_real_time_stats()
 
-                # Display connection status
+                # Build the whole frame and write it in one syscall (starting
+                # with the ANSI clear-screen sequence) instead of ~25 print
+                # calls each taking the stdout lock separately
                 status = "Connected" if stats["is_connected"] else "Disconnected"
-                print(f"Status: {status}")
-                print(f"Uptime: {stats['uptime_str']}")
-                print()
-
-                # Display metrics
-                print("Statistics: Metrics:")
-                print(f"  Messages: {stats['total_messages']}")
-                print(f"  Errors: {stats['total_errors']}")
-                print(f"  Error Rate: {stats['error_rate']:.1%}")
-                print(f"  Messages/sec: {stats['messages_per_second']:.2f}")
-                print()
-
-                # Display performance
+                lines = [
+                    "\033[2J\033[HAnalysis: PocketOption API Connection Monitor",
+                    "=" * 60,
+                    f"Status: {status}",
+                    f"Uptime: {stats['uptime_str']}",
+                    "",
+                    "Statistics: Metrics:",
+                    f"  Messages: {stats['total_messages']}",
+                    f"  Errors: {stats['total_errors']}",
+                    f"  Error Rate: {stats['error_rate']:.1%}",
+                    f"  Messages/sec: {stats['messages_per_second']:.2f}",
+                    "",
+                ]
+
                 if "avg_response_time" in stats:
-                    print("Performance:")
-                    print(f"  Avg Response: {stats['avg_response_time']:.3f}s")
-                    print(f"  Min Response: {stats['min_response_time']:.3f}s")
-                    print(f"  Max Response: {stats['max_response_time']:.3f}s")
-                    print()
+                    lines += [
+                        "Performance:",
+                        f"  Avg Response: {stats['avg_response_time']:.3f}s",
+                        f"  Min Response: {stats['min_response_time']:.3f}s",
+                        f"  Max Response: {stats['max_response_time']:.3f}s",
+                        "",
+                    ]
 
-                # Display memory if available
                 if "memory_usage_mb" in stats:
-                    print("Resources:")
-                    print(f"  Memory: {stats['memory_usage_mb']:.1f} MB")
-                    print(f"  CPU: {stats['cpu_percent']:.1f}%")
-                    print()
+                    lines += [
+                        "Resources:",
+                        f"  Memory: {stats['memory_usage_mb']:.1f} MB",
+                        f"  CPU: {stats['cpu_percent']:.1f}%",
+                        "",
+                    ]
 
-                # Display message types
                 if stats["message_types"]:
-                    print("Message: Message Types:")
-                    for msg_type, count in stats["message_types"].items():
-                        print(f"  {msg_type}: {count}")
-                    print()
-
-                print("Press Ctrl+C to stop monitoring...")
+                    lines.append("Message: Message Types:")
+                    lines.extend(
+                        f"  {msg_type}: {count}"
+                        for msg_type, count in stats["message_types"].items()
+                    )
+                    lines.append("")
+
+                lines.append("Press Ctrl+C to stop monitoring...")
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
 
                 await asyncio.sleep(2)  # Update every 2 seconds
 
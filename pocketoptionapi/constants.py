@@ -2,7 +2,7 @@
 Constants and configuration for the PocketOption API
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 import random
 
 # Asset mappings with their corresponding IDs
@@ -165,10 +165,15 @@ class Regions:
         "SERVER4": "wss://api-us-south.po.market/socket.io/?EIO=4&transport=websocket",
     }
 
+    # Derived tuples computed once at class creation - accessors hand out
+    # copies of these instead of re-filtering the mapping per call
+    _ALL_URLS = tuple(_REGIONS.values())
+    _DEMO_URLS = tuple(url for name, url in _REGIONS.items() if "DEMO" in name)
+
     @classmethod
     def get_all(cls, randomize: bool = True) -> List[str]:
         """Get all region URLs"""
-        urls = list(cls._REGIONS.values())
+        urls = list(cls._ALL_URLS)
         if randomize:
             random.shuffle(urls)
         return urls
@@ -178,8 +183,6 @@ class Regions:
         """Get all regions as a dictionary"""
         return cls._REGIONS.copy()
 
-    from typing import Optional
-
     @classmethod
     def get_region(cls, region_name: str) -> Optional[str]:
         """Get specific region URL"""
@@ -188,7 +191,7 @@ class Regions:
     @classmethod
     def get_demo_regions(cls) -> List[str]:
         """Get demo region URLs"""
-        return [url for name, url in cls._REGIONS.items() if "DEMO" in name]
+        return list(cls._DEMO_URLS)
 
 
 # Global constants
@@ -363,13 +363,19 @@ class HealthChecker:
         self.health_status: Dict[str, Dict[str, Any]] = {}
         self._running = False
         self._health_task: Optional[asyncio.Task] = None
+        # Short-TTL report cache so bursts of callers (stats endpoints,
+        # dashboards) share one assembled report per check cycle
+        self._report_cache: Optional[Dict[str, Any]] = None
+        self._report_cached_at: float = 0.0
 
     def register_health_check(self, name: str, check_func: Callable):
         """Register a health check function"""
         self.health_checks[name] = check_func
 
     async def start_monitoring(self):
-        """Start health monitoring"""
+        """Start health monitoring (no-op if already running)"""
+        if self._running:
+            return
         self._running = True
         self._health_task = asyncio.create_task(self._health_check_loop())
 
@@ -417,7 +423,11 @@ class HealthChecker:
                 await asyncio.sleep(self.check_interval)
 
     def get_health_report(self) -> Dict[str, Any]:
-        """Get comprehensive health report"""
+        """Get comprehensive health report (cached for a couple of seconds)"""
+        now = time.monotonic()
+        if self._report_cache is not None and now - self._report_cached_at < 2.0:
+            return self._report_cache
+
         overall_status = "healthy"
         unhealthy_services = []
 
@@ -428,12 +438,15 @@ class HealthChecker:
                 )
                 unhealthy_services.append(service)
 
-        return {
+        report = {
             "overall_status": overall_status,
             "services": self.health_status,
             "unhealthy_services": unhealthy_services,
             "timestamp": datetime.now(),
         }
+        self._report_cache = report
+        self._report_cached_at = now
+        return report
 
 
 # Global monitoring instances
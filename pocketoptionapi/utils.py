@@ -6,11 +6,17 @@ import asyncio
 import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from .models import Candle, OrderResult
 
+# Common spellings mapped once at import - avoids a .lower() allocation per
+# call and rejects unknown directions instead of silently treating them as put
+_DIRECTION_IS_CALL = {s: True for s in ("call", "CALL", "Call")}
+_DIRECTION_IS_CALL.update({s: False for s in ("put", "PUT", "Put")})
+
 
 def format_session_id(
     session_id: str,
@@ -62,10 +68,12 @@ def calculate_payout_percentage(
     Returns:
         float: Payout percentage
     """
-    if direction.lower() == "call":
-        win = exit_price > entry_price
-    else:  # put
-        win = exit_price < entry_price
+    try:
+        is_call = _DIRECTION_IS_CALL[direction]
+    except KeyError:
+        raise ValueError(f"Invalid direction: {direction!r}")
+
+    win = exit_price > entry_price if is_call else exit_price < entry_price
 
     return payout_rate if win else -1.0
 
@@ -400,21 +408,22 @@ def candles_to_dataframe(candles: List[Candle]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Candles as DataFrame
     """
-    data = []
-    for candle in candles:
-        data.append(
-            {
-                "timestamp": candle.timestamp,
-                "open": candle.open,
-                "high": candle.high,
-                "low": candle.low,
-                "close": candle.close,
-                "volume": candle.volume,
-                "asset": candle.asset,
-            }
-        )
-
-    df = pd.DataFrame(data)
+    # Column-wise build: timestamps are converted to datetime64 in one bulk
+    # numpy pass instead of per-row coercion, and each field becomes a
+    # contiguous column without a dict allocation per candle
+    df = pd.DataFrame(
+        {
+            "timestamp": np.asarray(
+                [candle.timestamp for candle in candles], dtype="datetime64[us]"
+            ),
+            "open": [candle.open for candle in candles],
+            "high": [candle.high for candle in candles],
+            "low": [candle.low for candle in candles],
+            "close": [candle.close for candle in candles],
+            "volume": [candle.volume for candle in candles],
+            "asset": [candle.asset for candle in candles],
+        }
+    )
     if not df.empty:
         df.set_index("timestamp", inplace=True)
         df.sort_index(inplace=True)
@@ -18,6 +18,15 @@ from .models import ConnectionInfo, ConnectionStatus, ServerTime
 from .constants import CONNECTION_SETTINGS, DEFAULT_HEADERS
 from .exceptions import WebSocketError, ConnectionError
 
+try:
+    # orjson parses the inbound JSON frames straight from bytes, skipping
+    # the str round trip stdlib json would need; fall back when unavailable
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 
 class MessageBatcher:
     """Batch messages to improve performance"""
@@ -123,6 +132,8 @@ class AsyncWebSocketClient:
         self.connection_info: Optional[ConnectionInfo] = None
         self.server_time: Optional[ServerTime] = None
         self._ping_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._last_sent_at: float = 0.0
         self._message_queue: asyncio.Queue = asyncio.Queue()
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._running = False
@@ -175,6 +186,9 @@ class AsyncWebSocketClient:
                         ping_interval=CONNECTION_SETTINGS["ping_interval"],
                         ping_timeout=CONNECTION_SETTINGS["ping_timeout"],
                         close_timeout=CONNECTION_SETTINGS["close_timeout"],
+                        # Frames are small JSON strings; deflate costs more
+                        # CPU per message than the bytes it saves
+                        compression=None,
                     ),
                     timeout=10.0,
                 )
@@ -245,7 +259,7 @@ class AsyncWebSocketClient:
             json_str = message[json_start_index : json_end_index + 1]
 
             # Parse the extracted JSON string
-            data: List[List[Any]] = json.loads(json_str)
+            data: List[List[Any]] = _json_loads(json_str)
 
             # Iterate through each asset's payout information
             for asset_data in data:
@@ -298,12 +312,15 @@ class AsyncWebSocketClient:
         self._running = False
 
         # Cancel background tasks
-        if self._ping_task and not self._ping_task.done():
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
+        tasks = [
+            task
+            for task in (self._ping_task, self._flush_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # Close WebSocket connection
         if self.websocket:
@@ -332,11 +349,34 @@ class AsyncWebSocketClient:
 
         try:
             await self.websocket.send(message)
+            self._last_sent_at = time.monotonic()
             logger.debug(f"Sent message: {message}")
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             raise WebSocketError(f"Failed to send message: {e}")
 
+    async def send_many(self, messages: List[str]) -> None:
+        """
+        Send a batch of messages with one connected-check and error scope
+
+        Messages queued within the same event-loop tick share the await chain
+        instead of each paying its own guard and exception frame.
+
+        Args:
+            messages: Messages to send, in order
+        """
+        if not self.websocket or self.websocket.closed:
+            raise WebSocketError("WebSocket is not connected")
+
+        try:
+            for message in messages:
+                await self.websocket.send(message)
+                logger.debug(f"Sent message: {message}")
+            self._last_sent_at = time.monotonic()
+        except Exception as e:
+            logger.error(f"Failed to send message batch: {e}")
+            raise WebSocketError(f"Failed to send message batch: {e}")
+
     async def send_message_optimized(self, message: str) -> None:
         """
         Send message with batching optimization
@@ -356,9 +396,7 @@ class AsyncWebSocketClient:
 
                 # Send batch if ready
                 if batch:
-                    for msg in batch:
-                        await self.websocket.send(msg)
-                        logger.debug(f"Sent batched message: {msg}")
+                    await self.send_many(batch)
 
                 # Update connection stats
                 response_time = time.time() - start_time
@@ -410,7 +448,21 @@ class AsyncWebSocketClient:
         """
         if event not in self._event_handlers:
             self._event_handlers[event] = []
-        self._event_handlers[event].append(handler)
+        self._event_handlers[event].append(
+            (handler, asyncio.iscoroutinefunction(handler))
+        )
+
+    def add_event_handlers(self, handlers: Dict[str, Callable]) -> None:
+        """
+        Add several event handlers in one call
+
+        Args:
+            handlers: Mapping of event name to handler function
+        """
+        for event, handler in handlers.items():
+            self._event_handlers.setdefault(event, []).append(
+                (handler, asyncio.iscoroutinefunction(handler))
+            )
 
     def remove_event_handler(self, event: str, handler: Callable) -> None:
         """
@@ -421,10 +473,9 @@ class AsyncWebSocketClient:
             handler: Handler function to remove
         """
         if event in self._event_handlers:
-            try:
-                self._event_handlers[event].remove(handler)
-            except ValueError:
-                pass
+            self._event_handlers[event] = [
+                pair for pair in self._event_handlers[event] if pair[0] is not handler
+            ]
 
     async def _send_handshake(self, ssid: str) -> None:
         """Send initial handshake messages (following old API pattern exactly)"""
@@ -488,9 +539,31 @@ class AsyncWebSocketClient:
         # Start ping task
         self._ping_task = asyncio.create_task(self._ping_loop())
 
+        # Drain messages the batcher is holding past its timeout
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
         # Start message receiving task (only start it once here)
         asyncio.create_task(self.receive_messages())
 
+    async def _flush_loop(self) -> None:
+        """Flush batched messages that no follow-up message pushed out
+
+        send_message_optimized only emits a batch when another message
+        arrives, so without this consumer a trailing message could sit in
+        the batcher indefinitely.
+        """
+        timeout = self._message_batcher.batch_timeout
+        while self._running and self.websocket:
+            try:
+                await asyncio.sleep(timeout)
+                batch = await self._message_batcher.flush_batch()
+                if batch and self.websocket and not self.websocket.closed:
+                    await self.send_many(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Batch flush error: {e}")
+
     async def _ping_loop(self) -> None:
         """Send periodic ping messages"""
         while self._running and self.websocket:
@@ -525,10 +598,9 @@ class AsyncWebSocketClient:
         try:
             # Handle bytes messages first (like old API) - these contain balance data
             if isinstance(message, bytes):
-                decoded_message = message.decode("utf-8")
                 try:
-                    # Try to parse as JSON (like old API)
-                    json_data = json.loads(decoded_message)
+                    # Parse straight from the bytes frame (like old API)
+                    json_data = _json_loads(message)
                     logger.debug(f"Received JSON bytes message: {json_data}")
 
                     # Handle balance data (like old API)
@@ -552,9 +624,9 @@ class AsyncWebSocketClient:
                     else:
                         await self._emit_event("json_data", json_data)
 
-                except json.JSONDecodeError:
+                except ValueError:
                     # If not JSON, treat as regular bytes message
-                    logger.debug(f"Non-JSON bytes message: {decoded_message[:100]}...")
+                    logger.debug(f"Non-JSON bytes message: {message[:100]!r}...")
 
                 return
 
@@ -578,7 +650,7 @@ class AsyncWebSocketClient:
             elif message.startswith("451-["):
                 # Parse JSON message
                 json_part = message.split("-", 1)[1]
-                data = json.loads(json_part)
+                data = _json_loads(json_part)
                 await self._handle_json_message(data)
 
             elif message.startswith("42") and "NotAuthorized" in message:
@@ -605,7 +677,7 @@ class AsyncWebSocketClient:
     async def _handle_json_message_wrapper(self, message: str) -> None:
         """Handle JSON message wrapper"""
         json_part = message.split("-", 1)[1]
-        data = json.loads(json_part)
+        data = _json_loads(json_part)
         await self._handle_json_message(data)
 
     async def _handle_auth_message(self, message: str) -> None:
@@ -706,15 +778,20 @@ class AsyncWebSocketClient:
             event: Event name
             data: Event data
         """
-        if event in self._event_handlers:
-            for handler in self._event_handlers[event]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data)
-                    else:
-                        handler(data)
-                except Exception as e:
-                    logger.error(f"Error in event handler for {event}: {e}")
+        handlers = self._event_handlers.get(event)
+        if not handlers:
+            return
+
+        # Coroutine-ness is resolved at registration, so the fan-out is a
+        # plain loop with no per-handler introspection
+        for handler, is_coro in handlers:
+            try:
+                if is_coro:
+                    await handler(data)
+                else:
+                    handler(data)
+            except Exception as e:
+                logger.error(f"Error in event handler for {event}: {e}")
 
     async def _handle_disconnect(self) -> None:
         """Handle WebSocket disconnection"""
@@ -753,6 +830,11 @@ class AsyncWebSocketClient:
         except Exception:
             return "UNKNOWN"
 
+    @property
+    def last_sent_at(self) -> float:
+        """Monotonic timestamp of the most recent outbound frame"""
+        return self._last_sent_at
+
     @property
     def is_connected(self) -> bool:
         """Check if WebSocket is connected"""